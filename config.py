@@ -0,0 +1,46 @@
+"""Service configuration, read from the environment once per process.
+
+Both the API process and the signing workers call ``get_settings()``, so
+environment parsing and validation live in one place. Field names are the
+lowercase form of their environment variables.
+"""
+import os
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict, Field, SecretStr, model_validator
+
+
+class Settings(BaseModel):
+    # Inputs are hidden in validation errors: the input is all of os.environ
+    model_config = ConfigDict(alias_generator=str.upper, frozen=True, hide_input_in_errors=True)
+
+    xrpl_ws_url: str = "wss://s.altnet.rippletest.net:51233"
+    # Replaced by XRPL_WS_URL; only read to refuse a stale deployment
+    xrpl_rpc_url: str | None = None
+    xrpl_ws_pool_size: int = Field(2, ge=1)
+    # One per signature of a mint. Not os.cpu_count(): in a container that
+    # is the host's count, and every worker is started (~56MB each) at boot.
+    sign_workers: int = Field(2, ge=1)
+    log_level: str = "WARNING"
+
+    # Secret seeds; SecretStr keeps them out of reprs
+    issuer_seed: SecretStr = Field(min_length=1)
+    signer1_seed: SecretStr = Field(min_length=1)
+    signer2_seed: SecretStr = Field(min_length=1)
+
+    @model_validator(mode="after")
+    def check_node_url(self) -> "Settings":
+        # Without this, a deployment that still sets only XRPL_RPC_URL would
+        # quietly fall back to the testnet default
+        if self.xrpl_rpc_url and "xrpl_ws_url" not in self.model_fields_set:
+            raise ValueError("XRPL_RPC_URL is no longer read; set XRPL_WS_URL to the node's websocket URL")
+        return self
+
+    @property
+    def signer_seeds(self) -> tuple:
+        return (self.signer1_seed, self.signer2_seed)
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings.model_validate(os.environ)
@@ -1,113 +1,524 @@
-import os
-import json
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from xrpl.clients import JsonRpcClient
+import asyncio
+import datetime
+from decimal import Decimal
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from contextlib import asynccontextmanager
+import websockets
+import orjson
+from cachetools import TTLCache
+from fastapi import FastAPI, Header
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from xrpl.asyncio.clients import AsyncWebsocketClient
+from xrpl.asyncio.clients.utils import request_to_websocket
+from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException, XRPLWebsocketException
 from xrpl.wallet import Wallet
-from xrpl.models.transactions import Payment
-from xrpl.models.amounts import IssuedCurrencyAmount
-from xrpl.models.requests import AccountInfo, Submit
-from xrpl.transaction import sign
-from xrpl.core.binarycodec import encode
+from xrpl.models.requests import AccountInfo, ServerInfo, Subscribe, SubmitOnly, Tx
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
+from config import get_settings
+from mint_codec import MintCodec, account_id, iou_value, issued_amount
+import signing
 
 # ─── CONFIGURATION ─────────────────────────────────────────────────
-RPC_URL = os.getenv(
-    "XRPL_RPC_URL",
-    "https://s.altnet.rippletest.net:51234"
-)
-client = JsonRpcClient(RPC_URL)
+settings = get_settings()    # raises at import on missing or invalid env vars
+REQUEST_TIMEOUT = 10.0
+HEALTH_CHECK_INTERVAL = 30    # seconds between server_info pings per socket
+
+class XrplWebsocket(AsyncWebsocketClient):
+    """AsyncWebsocketClient that only queues unsolicited (stream) messages
+    and speaks JSON through orjson rather than the stdlib.
+
+    The stock handler also queues every request's reply, which grows
+    without bound on a socket nobody iterates.
+    """
+
+    async def _do_send_no_future(self, request):
+        # Sent as text: rippled expects text frames, not binary
+        await self._websocket.send(orjson.dumps(request_to_websocket(request)).decode())
+
+    async def _handler(self):
+        try:
+            async for message in self._websocket:
+                message = orjson.loads(message)
+                future = self._open_requests.get(message.get("id"))
+                if future is None:
+                    self._messages.put_nowait(message)
+                elif not future.done():    # may have timed out already
+                    future.set_result(message)
+        finally:
+            # Wake a stream reader blocked on the queue: None means closed
+            if self._messages is not None:
+                self._messages.put_nowait(None)
+
+class XrplPool:
+    """A few persistent websockets to one node, used round-robin so a slow
+    reply doesn't hold up every other request; dropped sockets are replaced."""
+
+    def __init__(self, url: str, size: int) -> None:
+        self.url = url
+        self.sockets = [XrplWebsocket(url) for _ in range(size)]
+        self._next = 0
+        self._reconnect_lock = asyncio.Lock()
+
+    async def open(self) -> None:
+        await asyncio.gather(*(ws.open() for ws in self.sockets))
+
+    async def close(self) -> None:
+        await asyncio.gather(*(ws.close() for ws in self.sockets))
+
+    async def _socket(self) -> XrplWebsocket:
+        slot = self._next
+        self._next = (slot + 1) % len(self.sockets)
+        return await self._open_socket(slot)
+
+    async def _open_socket(self, slot: int) -> XrplWebsocket:
+        if not self.sockets[slot].is_open():
+            async with self._reconnect_lock:
+                if not self.sockets[slot].is_open():
+                    ws = XrplWebsocket(self.url)
+                    await ws.open()
+                    self.sockets[slot] = ws
+        return self.sockets[slot]
+
+    async def request(self, request):
+        ws = await self._socket()
+        return await asyncio.wait_for(ws.request(request), REQUEST_TIMEOUT)
+
+    async def ping(self) -> None:
+        """Send server_info down every socket, reopening any that dropped."""
+        async def ping_one(slot: int) -> None:
+            ws = await self._open_socket(slot)
+            await asyncio.wait_for(ws.request(ServerInfo()), REQUEST_TIMEOUT)
+
+        results = await asyncio.gather(
+            *(ping_one(slot) for slot in range(len(self.sockets))),
+            return_exceptions=True
+        )
+        for slot, result in enumerate(results):
+            if isinstance(result, Exception):
+                log.warning("health check failed on socket %d: %r", slot, result)
+
+client = XrplPool(settings.xrpl_ws_url, settings.xrpl_ws_pool_size)
 
-# Load and validate secret seeds
-ISSUER_SEED   = os.getenv("ISSUER_SEED")
-SIGNER1_SEED  = os.getenv("SIGNER1_SEED")
-SIGNER2_SEED  = os.getenv("SIGNER2_SEED")
-for key, val in [("ISSUER_SEED", ISSUER_SEED), ("SIGNER1_SEED", SIGNER1_SEED), ("SIGNER2_SEED", SIGNER2_SEED)]:
-    if not val:
-        raise RuntimeError(f"Missing environment variable: {key}")
+async def rpc(request) -> dict:
+    """Send a request and return its result, raising on an error response."""
+    response = await client.request(request)
+    if not response.is_successful():
+        raise XRPLRequestFailureException(response.result)
+    return response.result
 
-# Initialize wallets with sequence placeholder
-issuer_wallet  = Wallet(ISSUER_SEED, 0)
-signer1_wallet = Wallet(SIGNER1_SEED, 0)
-signer2_wallet = Wallet(SIGNER2_SEED, 0)
+logging.basicConfig(level=settings.log_level)
+log = logging.getLogger("rcq_tbill")
+audit_log = logging.getLogger("rcq_tbill.audit")
+audit_log.setLevel(logging.INFO)
+
+# Initialize the issuer wallet with sequence placeholder. Key derivation
+# happens here, once per process; handlers only reuse the derived address.
+# Signer keys are derived inside each signing worker (see signing.py).
+issuer_wallet  = Wallet(settings.issuer_seed.get_secret_value(), 0)
+ISSUER_ADDR = issuer_wallet.classic_address
+ISSUER_ACCOUNT_ID = account_id(ISSUER_ADDR)
+SIGNER_COUNT = len(settings.signer_seeds)
 
 # RCQ-TBILL custom token code (40-character HEX)
 CURRENCY_HEX = "5243512D5442494C4C0000000000000000000000"
+CURRENCY_BYTES = bytes.fromhex(CURRENCY_HEX)
+
+# XRPL-form fields shared by every mint; only the amount and Sequence vary
+_PAYMENT_TEMPLATE = {
+    "TransactionType": "Payment",
+    "Account": ISSUER_ADDR,
+    "Destination": ISSUER_ADDR,
+    "Fee": "12",
+    "Flags": 0,
+    "SigningPubKey": "",
+}
+# Pre-encoded canonical bytes of the template; only these fields vary
+PAYMENT_CODEC = MintCodec(_PAYMENT_TEMPLATE, varying=("Sequence", "Amount", "SendMax"))
 
 # ─── Pydantic Models ─────────────────────────────────────────────────
 class MintRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
     cusip: str
-    amount: float
-    date: str    # ISO 8601 date string
+    amount: Decimal = Field(..., gt=0)    # exact decimal, never a float
+    date: datetime.date    # ISO 8601 date, parsed by pydantic-core
+
+    @field_validator("cusip")
+    @classmethod
+    def check_cusip(cls, v: str) -> str:
+        # Fixed-width [A-Z0-9]{9}: plain str checks, no regex engine
+        if len(v) != 9 or not (v.isascii() and v.isalnum()) or v != v.upper():
+            raise ValueError("cusip must be 9 uppercase letters or digits")
+        return v
+
+    @field_validator("amount", mode="before")
+    @classmethod
+    def refuse_float_amount(cls, v):
+        # A JSON number is parsed to a float before validation, which already
+        # rounds past ~16 digits (8.000000000000001 becomes ...002)
+        if isinstance(v, float):
+            raise ValueError("amount must be a decimal string, not a JSON number with a fraction or exponent")
+        return v
+
+    @field_validator("amount")
+    @classmethod
+    def check_amount_digits(cls, v: Decimal) -> Decimal:
+        # Issued-currency values hold 16 significant digits; unlike
+        # max_digits this counts 1e20 as one. The exponent range is left
+        # to iou_value.
+        if len("".join(map(str, v.as_tuple().digits)).strip("0")) > 16:
+            raise ValueError("amount must have at most 16 significant digits")
+        return v
 
 class MintResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     status: str
     tx_hash: str
 
-# ─── FastAPI App ────────────────────────────────────────────────────
-app = FastAPI(title="RCQ-TBILL Multisig Issuance API")
+    def to_json(self) -> str:
+        return self.model_dump_json(exclude_none=True)
 
-@app.get("/")
-async def root():
-    return {"message": "RCQ-TBILL API is live. Use /docs for API."}
+class PydanticResponse(JSONResponse):
+    """Renders a model with its own JSON serializer instead of jsonable_encoder."""
 
-@app.post("/mint", response_model=MintResponse)
-def mint_tbill(req: MintRequest):
-    try:
-        # 1) Fetch current sequence
-        acct_info = client.request(
-            AccountInfo(
-                account=issuer_wallet.classic_address,
-                ledger_index="current"
-            )
-        ).result
-        sequence = acct_info["account_data"]["Sequence"]
-
-        # 2) Build unsigned Payment transaction
-        issued_amt = IssuedCurrencyAmount(
-            currency=CURRENCY_HEX,
-            issuer=issuer_wallet.classic_address,
-            value=str(req.amount)
-        )
-        payment_tx = Payment(
-            account=issuer_wallet.classic_address,
-            destination=issuer_wallet.classic_address,
-            amount=issued_amt,
-            send_max=issued_amt,
-            sequence=sequence,
-            fee="12",
-            signing_pub_key=""
+    def render(self, content: BaseModel) -> bytes:
+        return content.to_json().encode("utf-8")
+
+# ─── Issuer Sequence ────────────────────────────────────────────────
+# This service is the only signer for the issuer account, so the next
+# Sequence is known locally: seed it once from AccountInfo and advance it
+# per mint, refetching only when the ledger reports a sequence mismatch.
+SEQUENCE_ERRORS = ("terPRE_SEQ", "tefPAST_SEQ")
+ACCEPTED_RESULTS = ("tesSUCCESS", "terQUEUED")    # on its way into a ledger
+UNCONSUMED_RESULTS = ("tem", "tef", "tel")    # tx never used its sequence
+_next_sequence = None
+_sequence_lock = asyncio.Lock()
+
+async def fetch_sequence() -> int:
+    acct_info = await rpc(
+        AccountInfo(
+            account=ISSUER_ADDR,
+            ledger_index="current"
         )
+    )
+    return acct_info["account_data"]["Sequence"]
+
+async def resync_sequence() -> None:
+    global _next_sequence
+    async with _sequence_lock:
+        _next_sequence = await fetch_sequence()
 
-        # 3) Each signer signs the same tx
-        sig1 = sign(payment_tx, signer1_wallet, multisign=True)
-        sig2 = sign(payment_tx, signer2_wallet, multisign=True)
+async def reserve_sequence() -> int:
+    global _next_sequence
+    async with _sequence_lock:
+        if _next_sequence is None:
+            _next_sequence = await fetch_sequence()
+        sequence = _next_sequence
+        _next_sequence += 1
+        return sequence
 
-        # 4) Collect SignerEntry dicts
-        signers = [entry.to_dict() for entry in sig1.signers] + [entry.to_dict() for entry in sig2.signers]
+async def release_sequence(sequence: int) -> None:
+    # Hand back a reserved sequence that never reached the ledger, so the
+    # next mint doesn't hit terPRE_SEQ on the gap. Only possible while no
+    # later sequence has been handed out.
+    global _next_sequence
+    async with _sequence_lock:
+        if _next_sequence == sequence + 1:
+            _next_sequence = sequence
 
-        # 5) Prepare multisigned payload
-        multi_payload = {**payment_tx.to_dict(), "Signers": signers}
+# ─── Mint Submission ────────────────────────────────────────────────
+TX_HASH_PREFIX = bytes.fromhex("54584E00")    # "TXN\0"
+VALIDATION_TIMEOUT = 30    # seconds; several ledger closes
 
-        # 6) Encode to transaction blob
-        blob = encode(multi_payload)
+def tx_hash(blob: bytes) -> str:
+    """The ledger hash of a signed tx blob, computed without a round-trip."""
+    return hashlib.sha512(TX_HASH_PREFIX + blob).digest()[:32].hex().upper()
 
-        # 7) Submit via JSON-RPC using tx_blob
-        submission = Submit(tx_blob=blob)
-        resp = client.request(submission).result
-        if resp.get("engine_result") != "tesSUCCESS":
-            raise HTTPException(
-                status_code=500,
-                detail=f"XRPL error: {resp.get('engine_result')}"
-            )
+# Signing processes, started by the lifespan; one signature per task so a
+# mint's signatures run on separate cores.
+sign_pool = None
 
-        return MintResponse(status="success", tx_hash=resp["tx_json"]["hash"])
+async def start_sign_pool() -> None:
+    global sign_pool
+    # spawn, not fork: the parent already runs an event loop and threads
+    sign_pool = ProcessPoolExecutor(
+        max_workers=settings.sign_workers,
+        mp_context=get_context("spawn"),
+        initializer=signing.init_worker,
+    )
+    # Workers start on demand; start them all now, so the first mints don't
+    # pay for process startup and bad seeds fail the deploy, not a request
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(
+        loop.run_in_executor(sign_pool, signing.worker_ready)
+        for _ in range(settings.sign_workers)
+    ))
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Mint failed: {e}")
+class SubmitOutcomeUnknown(Exception):
+    """The blob may have reached the node, but no engine result came back."""
 
+    def __init__(self, mint_hash: str) -> None:
+        super().__init__(mint_hash)
+        self.mint_hash = mint_hash
 
+async def submit_mint(value: Decimal, sequence: int) -> tuple:
+    """Sign and submit one mint; returns (tx hash, preliminary engine result).
 
+    Raises ``SubmitOutcomeUnknown`` with the hash if the submit times out or
+    its socket drops, since the tx may still be applied.
+    """
+    # 1) Encode the unsigned Payment: pre-encoded template + varying fields.
+    # Amount and SendMax are the same issued amount, serialized once.
+    issued_amt = issued_amount(iou_value(value), CURRENCY_BYTES, ISSUER_ACCOUNT_ID)
+    fields = PAYMENT_CODEC.encode_fields({
+        "Amount": issued_amt,
+        "SendMax": issued_amt,
+        "Sequence": sequence.to_bytes(4, "big"),
+    })
 
+    # 2) Each signer signs the same tx, concurrently in the signing pool;
+    # the payloads differ only in the trailing signer AccountID
+    signing_prefix = PAYMENT_CODEC.multisigning_prefix(fields)
+    loop = asyncio.get_running_loop()
+    signers = await asyncio.gather(*[
+        loop.run_in_executor(sign_pool, signing.sign_in_worker, signing_prefix, slot)
+        for slot in range(SIGNER_COUNT)
+    ])
+
+    # 3) Append the Signers array to get the transaction blob
+    blob = PAYMENT_CODEC.encode_blob(fields, signers)
+
+    # 4) Submit via JSON-RPC using tx_blob; the hash is known up front, so
+    # a lost reply still leaves a tx to track
+    mint_hash = tx_hash(blob)
+    try:
+        result = await rpc(SubmitOnly(tx_blob=blob.hex().upper()))
+    except (asyncio.TimeoutError, OSError, websockets.ConnectionClosed, XRPLWebsocketException) as e:
+        raise SubmitOutcomeUnknown(mint_hash) from e
+    return mint_hash, result.get("engine_result")
+
+# Validated issuer txs are pushed by a subscription instead of polled for
+_pending_validations = {}    # tx hash -> Future resolved by the stream
+
+async def follow_issuer_stream() -> None:
+    # Runs for the app's lifetime on its own socket, resubscribing after a drop
+    while True:
+        stream = XrplWebsocket(settings.xrpl_ws_url)
+        try:
+            await stream.open()
+            await stream.send(Subscribe(accounts=[ISSUER_ADDR]))
+            async for message in stream:
+                if message is None:
+                    break
+                if message.get("type") == "transaction" and message.get("validated"):
+                    future = _pending_validations.pop(message["transaction"]["hash"], None)
+                    if future is not None and not future.done():
+                        future.set_result(message["meta"]["TransactionResult"])
+        except asyncio.CancelledError:
+            await stream.close()
+            raise
+        except Exception:
+            log.exception("issuer stream failed; reconnecting")
+        await stream.close()
+        await asyncio.sleep(1)
+
+async def keep_pool_warm() -> None:
+    # Idle sockets get dropped by proxies and load balancers; touching each
+    # one periodically means a dead socket is replaced here, not on a /mint.
+    while True:
+        await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+        await client.ping()
+
+async def mint_once(value: Decimal) -> tuple:
+    """Submit one mint on the next sequence; returns (tx hash, engine result)."""
+    sequence = await reserve_sequence()
+    try:
+        mint_hash, engine_result = await submit_mint(value, sequence)
+    except (XRPLBinaryCodecException, XRPLRequestFailureException):
+        # Rejected before signing, or the node refused the request outright.
+        # SubmitOutcomeUnknown keeps the sequence: the tx may have used it.
+        await release_sequence(sequence)
+        raise
+    if engine_result[:3] in UNCONSUMED_RESULTS:
+        await release_sequence(sequence)
+    return mint_hash, engine_result
+
+async def wait_for_validation(mint_hash: str) -> None:
+    # Runs after /mint has answered: record the final engine result in the
+    # audit log once the tx lands in a validated ledger.
+    future = asyncio.get_running_loop().create_future()
+    _pending_validations[mint_hash] = future
+    try:
+        try:
+            result = await asyncio.wait_for(future, VALIDATION_TIMEOUT)
+        except asyncio.TimeoutError:
+            # The stream may have missed it (e.g. while reconnecting): ask once
+            tx = (await client.request(Tx(transaction=mint_hash))).result
+            if not tx.get("validated"):
+                audit_log.warning("mint %s not validated after %ds", mint_hash, VALIDATION_TIMEOUT)
+                return
+            result = tx["meta"]["TransactionResult"]
+        audit_log.info("mint %s validated: %s", mint_hash, result)
+    except Exception:
+        audit_log.exception("mint %s validation check failed", mint_hash)
+    finally:
+        _pending_validations.pop(mint_hash, None)
+
+# Strong references so pending validation tasks aren't garbage collected
+_validation_tasks = set()
+
+def track_validation(mint_hash: str) -> None:
+    task = asyncio.create_task(wait_for_validation(mint_hash))
+    _validation_tasks.add(task)
+    task.add_done_callback(_validation_tasks.discard)
+
+# ─── FastAPI App ────────────────────────────────────────────────────
+def check_routes(app: FastAPI) -> None:
+    # Registering a path/method twice on the same app silently shadows the
+    # later handler; refuse to start instead.
+    seen = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            if (route.path, method) in seen:
+                raise RuntimeError(f"Duplicate route: {method} {route.path}")
+            seen.add((route.path, method))
+    log.info("%d routes registered", len(app.routes))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    check_routes(app)
+    background = []
+    try:
+        # One set of XRPL sockets for the whole process, shared by all
+        # requests. Inside the try, so a later failed step still closes them.
+        await client.open()
+        await resync_sequence()
+        await start_sign_pool()
+        background.append(asyncio.create_task(follow_issuer_stream()))
+        background.append(asyncio.create_task(keep_pool_warm()))
+        yield
+    finally:
+        tasks = background + list(_validation_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await client.close()    # skips sockets that never opened
+        if sign_pool is not None:
+            # shutdown() joins the workers; keep that off the event loop
+            await asyncio.to_thread(sign_pool.shutdown, cancel_futures=True)
+
+app = FastAPI(
+    title="RCQ-TBILL Multisig Issuance API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+# Small bodies (e.g. /mint) pass through; larger JSON is gzipped on request
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Liveness probes hit / constantly; its body never changes
+_ROOT_BODY = orjson.dumps({"message": "RCQ-TBILL API is live. Use /docs for API."})
+
+@app.get("/")
+async def root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+# Node errors that mean "back off"
+RATE_LIMIT_ERRORS = ("slowDown", "tooBusy")
+
+def error_response(status_code: int, detail: str) -> ORJSONResponse:
+    return ORJSONResponse({"detail": detail}, status_code=status_code)
+
+# Recent mints by Idempotency-Key header, or by (cusip, date, amount)
+# without one -> (request, Future of their MintResponse). A client retry (or
+# a duplicate still in flight) gets the same hash back instead of a second,
+# fee-burning XRPL transaction.
+_recent_mints = TTLCache(maxsize=10_000, ttl=300)
+
+def mint_response(minted: MintResponse) -> PydanticResponse:
+    # 202: submitted, but the node's verdict was lost; the hash is tracked
+    return PydanticResponse(minted, status_code=202 if minted.status == "pending" else 200)
+
+def settle_mint(pending: asyncio.Future, mint_hash: str, status: str) -> PydanticResponse:
+    """Track the tx to validation and cache its response for retries."""
+    track_validation(mint_hash)
+    # Both fields are produced here, so skip MintResponse validation
+    minted = MintResponse.model_construct(status=status, tx_hash=mint_hash)
+    pending.set_result(minted)
+    return mint_response(minted)
+
+# No response_model: the body is built directly so FastAPI skips
+# re-validation and jsonable_encoder; MintResponse only documents it.
+@app.post("/mint", responses={200: {"model": MintResponse}, 202: {"model": MintResponse}})
+async def mint_tbill(req: MintRequest, idempotency_key: str | None = Header(None)):
+    key = ("key", idempotency_key) if idempotency_key else (req.cusip, req.date, req.amount)
+    while True:
+        previous = _recent_mints.get(key)
+        if previous is None:
+            break
+        previous_req, previous_mint = previous
+        if previous_req != req:
+            return error_response(422, "Idempotency-Key already used for a different mint")
+        minted = await asyncio.shield(previous_mint)
+        if minted is not None:
+            return mint_response(minted)
+        # That mint failed. Look again rather than claim the key: another
+        # waiter woken by the same failure may already be minting.
+    # Nothing awaits between the lookup and this insert, so no lock needed
+    pending = asyncio.get_running_loop().create_future()
+    _recent_mints[key] = (req, pending)
+
+    try:
+        mint_hash, engine_result = await mint_once(req.amount)
+        if engine_result in SEQUENCE_ERRORS:
+            # The cached sequence drifted from the ledger. tefPAST_SEQ means
+            # the tx was never applied, so it is safe to resubmit once.
+            await resync_sequence()
+            if engine_result == "tefPAST_SEQ":
+                mint_hash, engine_result = await mint_once(req.amount)
+        if engine_result == "terPRE_SEQ":
+            # The node may hold it until the gap fills, so it can still
+            # apply: track it like a submit whose reply was lost
+            return settle_mint(pending, mint_hash, "pending")
 
+        if engine_result not in ACCEPTED_RESULTS:
+            # tel: refused by this node alone (load, fee) and never applied
+            # or relayed, so a retry is safe. Anything else is final or may
+            # still apply, and must not be blindly resubmitted.
+            status = 503 if engine_result.startswith("tel") else 500
+            return error_response(status, f"XRPL error: {engine_result}")
 
+        # Answer on the preliminary result; finality is tracked off the
+        # request path. A queued tx is held for a later ledger, so it is
+        # cached like an applied one and a retry gets the same hash.
+        return settle_mint(pending, mint_hash, "success")
 
+    except SubmitOutcomeUnknown as e:
+        # The node may have the tx even though no reply came back: keep the
+        # key bound to its hash so a retry can't mint a second time
+        log.warning("mint %s submitted without a reply; tracking it", e.mint_hash)
+        return settle_mint(pending, e.mint_hash, "pending")
+    except XRPLRequestFailureException as e:
+        status = 429 if e.error in RATE_LIMIT_ERRORS else 502
+        return error_response(status, f"XRPL request failed: {e.error}")
+    except asyncio.TimeoutError:
+        return error_response(504, "XRPL node timed out")
+    except (OSError, websockets.ConnectionClosed, XRPLWebsocketException):
+        return error_response(503, "XRPL node unreachable")
+    except XRPLBinaryCodecException as e:
+        # e.g. an amount with more precision than an issued value can hold
+        return error_response(400, f"Invalid mint: {e}")
+    except Exception:
+        log.exception("mint failed")
+        return error_response(500, "Mint failed: internal error")
+    finally:
+        if not pending.done():
+            # Failed: forget it so a retry really mints, and release waiters
+            if key in _recent_mints and _recent_mints[key][1] is pending:
+                del _recent_mints[key]
+            pending.set_result(None)
@@ -0,0 +1,167 @@
+"""Specialised XRPL binary encoding for the RCQ-TBILL mint Payment.
+
+Every mint is the same Payment with only a few fields changing, so the
+canonical bytes of the constant fields are serialized once and the varying
+fields are spliced in per request instead of re-encoding the whole tx.
+"""
+from decimal import Decimal, InvalidOperation
+
+from xrpl.core.addresscodec import decode_classic_address
+from xrpl.core.binarycodec import encode
+from xrpl.core.binarycodec.definitions.definitions import get_field_instance, load_definitions
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
+from xrpl.core.binarycodec.field_id_codec import encode as encode_field_id
+
+MULTISIGN_PREFIX = bytes.fromhex("534D5400")    # "SMT\0"
+OBJECT_END = bytes.fromhex("E1")
+ARRAY_END = bytes.fromhex("F1")
+
+# Issued-currency value layout (see iou_value)
+IOU_ZERO = 0x8000000000000000    # "not XRP" bit; alone it encodes zero
+IOU_POSITIVE = 0x4000000000000000
+IOU_MIN_MANTISSA = 10**15
+IOU_MAX_MANTISSA = 10**16 - 1
+IOU_MIN_EXPONENT = -96
+IOU_MAX_EXPONENT = 80
+
+_DEFINITIONS = load_definitions()
+
+# Field name -> its 1-3 byte (type code, field code) header, packed once.
+# Pseudo-types such as Metadata have codes outside a byte and never appear
+# inside a tx, so they are left out.
+HEADER_BYTES = {
+    name: encode_field_id(name)
+    for name, info in _DEFINITIONS["FIELDS"].items()
+    if info["isSerialized"] and _DEFINITIONS["TYPES"][info["type"]] < 256
+}
+
+
+def field_bytes(name: str, value) -> bytes:
+    """Canonical header + value bytes of a single field."""
+    return bytes.fromhex(encode({name: value}))
+
+
+def iou_value(value: Decimal | str) -> bytes:
+    """8-byte value of an issued-currency amount, from a Decimal or a
+    decimal string.
+
+    The "not XRP" and sign bits, then the exponent (biased by 97) and a
+    mantissa normalized to 16 digits. Follows the ledger's range and
+    precision rules; xrpl-py's encoder is stricter and also refuses some
+    representable values, such as ones written with a positive exponent.
+    """
+    try:
+        sign, digits, exponent = Decimal(value).as_tuple()
+    except InvalidOperation:
+        raise XRPLBinaryCodecException(f"Invalid issued currency value: {value}") from None
+    if not isinstance(exponent, int):    # NaN, sNaN, Infinity
+        raise XRPLBinaryCodecException(f"Expected exponent to be int, is {exponent}")
+    mantissa = int("".join(map(str, digits)))
+    if mantissa == 0:
+        return IOU_ZERO.to_bytes(8, "big")
+    while mantissa % 10 == 0:
+        mantissa //= 10
+        exponent += 1
+    if mantissa > IOU_MAX_MANTISSA:
+        raise XRPLBinaryCodecException("Decimal precision out of range for issued currency value.")
+    while mantissa < IOU_MIN_MANTISSA:
+        mantissa *= 10
+        exponent -= 1
+    if not IOU_MIN_EXPONENT <= exponent <= IOU_MAX_EXPONENT:
+        raise XRPLBinaryCodecException("Decimal precision out of range for issued currency value.")
+    serial = IOU_ZERO | (exponent + 97) << 54 | mantissa
+    if sign == 0:
+        serial |= IOU_POSITIVE
+    return serial.to_bytes(8, "big")
+
+
+def issued_amount(value: bytes, currency: bytes, issuer: bytes) -> bytes:
+    """Serialized issued-currency Amount from its ``iou_value`` and the raw
+    20-byte currency code and issuer AccountID."""
+    return value + currency + issuer
+
+
+def vl_prefix(length: int) -> bytes:
+    """Length prefix of a variable-length field's value."""
+    if length <= 192:
+        return bytes([length])
+    if length <= 12480:
+        length -= 193
+        return bytes([193 + (length >> 8), length & 0xFF])
+    if length <= 918744:
+        length -= 12481
+        return bytes([241 + (length >> 16), (length >> 8) & 0xFF, length & 0xFF])
+    raise ValueError(f"Variable-length value too long: {length} bytes")
+
+
+def encode_signer(account: bytes, public_key: bytes, signature: bytes) -> bytes:
+    """One ``Signers`` array entry, written straight from raw key bytes.
+
+    The inner fields are laid out in canonical order by hand: SigningPubKey
+    and TxnSignature (Blob) before Account (AccountID).
+    """
+    return b"".join((
+        HEADER_BYTES["Signer"],
+        HEADER_BYTES["SigningPubKey"], vl_prefix(len(public_key)), public_key,
+        HEADER_BYTES["TxnSignature"], vl_prefix(len(signature)), signature,
+        HEADER_BYTES["Account"], vl_prefix(len(account)), account,
+        OBJECT_END,
+    ))
+
+
+class MintCodec:
+    """Encodes a tx whose fields are all constant except ``varying``.
+
+    Fields are laid out in canonical (type, nth) order: runs of constant
+    fields become pre-encoded byte segments and each varying field is a
+    slot filled per call with its already-serialized value. ``Signers`` is
+    not a signing field and sorts last, so it is appended after the signing
+    fields when building the blob.
+    """
+
+    def __init__(self, constant_fields: dict, varying: tuple) -> None:
+        for name in varying:
+            if get_field_instance(name).is_variable_length_encoded:
+                raise ValueError(f"{name} is length-prefixed and cannot vary")
+        names = sorted([*constant_fields, *varying], key=lambda n: get_field_instance(n).ordinal)
+        self.segments = []
+        for name in names:
+            if name in varying:
+                self.segments.append(name)
+            elif self.segments and isinstance(self.segments[-1], bytes):
+                self.segments[-1] += field_bytes(name, constant_fields[name])
+            else:
+                self.segments.append(field_bytes(name, constant_fields[name]))
+        if get_field_instance(names[-1]).ordinal > get_field_instance("Signers").ordinal:
+            raise ValueError(f"{names[-1]} would sort after Signers")
+
+    def encode_fields(self, values: dict) -> bytes:
+        """Signing fields of the tx, with ``values`` (field name -> value
+        bytes, no header) for the varying ones."""
+        out = bytearray()
+        for segment in self.segments:
+            if isinstance(segment, bytes):
+                out += segment
+            else:
+                out += HEADER_BYTES[segment]
+                out += values[segment]
+        return bytes(out)
+
+    @staticmethod
+    def multisigning_prefix(fields: bytes) -> bytes:
+        """The part of the multisigning payload shared by every signer.
+
+        Each signer signs this followed by its own 20-byte AccountID.
+        """
+        return MULTISIGN_PREFIX + fields
+
+    @staticmethod
+    def encode_blob(fields: bytes, signers: list) -> bytes:
+        """Full multisigned tx blob from its signing fields and the
+        ``encode_signer`` entries, already sorted by AccountID."""
+        return b"".join((fields, HEADER_BYTES["Signers"], *signers, ARRAY_END))
+
+
+def account_id(address: str) -> bytes:
+    """The 20-byte AccountID behind a classic address."""
+    return decode_classic_address(address)
@@ -0,0 +1,60 @@
+"""Multisigning for the RCQ-TBILL mint, run in worker processes.
+
+xrpl-py's Ed25519 signing is pure Python and holds the GIL, so signatures
+made on threads queue behind each other and behind the event loop. They
+run in a process pool instead. Each worker derives the signer keys from
+its settings once, in its initializer, so no key material is pickled.
+"""
+from typing import NamedTuple
+
+from xrpl.core.keypairs import sign as keypairs_sign
+from xrpl.wallet import Wallet
+
+from config import get_settings
+from mint_codec import account_id, encode_signer
+
+
+class SignerKey(NamedTuple):
+    """Everything a mint needs from one signer wallet, derived once."""
+    account_id: bytes
+    public_key: bytes
+    private_key: str
+
+
+def load_signer_keys() -> tuple:
+    """Signer keys from the settings, sorted by AccountID as XRPL requires
+    of the Signers array."""
+    keys = []
+    for seed in get_settings().signer_seeds:
+        wallet = Wallet(seed.get_secret_value(), 0)
+        keys.append(SignerKey(
+            account_id(wallet.classic_address),
+            bytes.fromhex(wallet.public_key),
+            wallet.private_key,
+        ))
+    return tuple(sorted(keys, key=lambda signer: signer.account_id))
+
+
+def multisign_entry(signing_prefix: bytes, signer: SignerKey) -> bytes:
+    """Sign for a multisigned tx and return the signer's encoded Signer entry."""
+    signature = keypairs_sign(signing_prefix + signer.account_id, signer.private_key)
+    return encode_signer(signer.account_id, signer.public_key, bytes.fromhex(signature))
+
+
+# ─── Worker side ────────────────────────────────────────────────────
+_worker_keys = ()
+
+
+def init_worker() -> None:
+    global _worker_keys
+    _worker_keys = load_signer_keys()
+
+
+def worker_ready() -> int:
+    """No-op task used to start and check a worker; returns its key count."""
+    return len(_worker_keys)
+
+
+def sign_in_worker(signing_prefix: bytes, slot: int) -> bytes:
+    """``multisign_entry`` for the ``slot``-th signer, in AccountID order."""
+    return multisign_entry(signing_prefix, _worker_keys[slot])
@@ -0,0 +1,7 @@
+import os
+
+# main reads its settings at import. These throwaway seeds belong to no
+# funded account; they only let the wallets and signing keys be derived.
+os.environ.setdefault("ISSUER_SEED", "sEdSRDpeBCK6m2obnBCawqSVzZQJhp8")
+os.environ.setdefault("SIGNER1_SEED", "sEdTtK1N86DiXBUJuuND4Lr176HZF7U")
+os.environ.setdefault("SIGNER2_SEED", "sEdS2hj9yKjNMK66NdcSLk47hKquzRe")
@@ -0,0 +1,32 @@
+import pytest
+from pydantic import ValidationError
+
+from config import Settings
+
+SEEDS = {"ISSUER_SEED": "s1", "SIGNER1_SEED": "s2", "SIGNER2_SEED": "s3"}
+
+
+def test_stale_rpc_url_alone_is_refused():
+    with pytest.raises(ValidationError, match="XRPL_WS_URL"):
+        Settings.model_validate({**SEEDS, "XRPL_RPC_URL": "https://s1.ripple.com:51234"})
+
+
+def test_ws_url_wins_over_stale_rpc_url():
+    settings = Settings.model_validate({
+        **SEEDS,
+        "XRPL_RPC_URL": "https://s1.ripple.com:51234",
+        "XRPL_WS_URL": "wss://s1.ripple.com",
+    })
+    assert settings.xrpl_ws_url == "wss://s1.ripple.com"
+
+
+def test_seed_values_stay_out_of_errors():
+    with pytest.raises(ValidationError) as err:
+        Settings.model_validate({"ISSUER_SEED": "sEdSecretValue", "SIGNER1_SEED": "x"})
+    assert "sEdSecretValue" not in str(err.value)
+
+
+def test_sign_workers_default_is_fixed():
+    # Not the CPU count, which in a container is the host's
+    assert Settings.model_validate(SEEDS).sign_workers == 2
+    assert Settings.model_validate({**SEEDS, "SIGN_WORKERS": "4"}).sign_workers == 4
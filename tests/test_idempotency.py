@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+import main
+
+MINT_HASH = "AB" * 32
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    main._recent_mints.clear()
+    yield
+    main._recent_mints.clear()
+
+
+@pytest.mark.parametrize("idempotency_key", [None, "retry-1"])
+def test_waiters_on_a_failed_mint_submit_it_once(monkeypatch, idempotency_key):
+    # The first attempt fails while identical requests wait on it. Only one
+    # waiter may resubmit; the rest must get that retry's hash. It takes
+    # three requests to catch two waiters both claiming the key.
+    calls = []
+
+    async def fake_mint_once(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return MINT_HASH, "telINSUF_FEE_P" if len(calls) == 1 else "tesSUCCESS"
+
+    monkeypatch.setattr(main, "mint_once", fake_mint_once)
+    monkeypatch.setattr(main, "track_validation", lambda mint_hash: None)
+    req = main.MintRequest(cusip="912796YB9", amount="100.5", date="2026-01-01")
+
+    async def send_all():
+        return await asyncio.gather(*(
+            main.mint_tbill(req, idempotency_key=idempotency_key) for _ in range(3)
+        ))
+
+    responses = asyncio.run(send_all())
+    assert [r.status_code for r in responses] == [503, 200, 200]
+    assert len(calls) == 2
+
+
+def test_idempotency_key_reused_for_another_mint(monkeypatch):
+    async def fake_mint_once(value):
+        return MINT_HASH, "tesSUCCESS"
+
+    monkeypatch.setattr(main, "mint_once", fake_mint_once)
+    monkeypatch.setattr(main, "track_validation", lambda mint_hash: None)
+    first = main.MintRequest(cusip="912796YB9", amount="100.5", date="2026-01-01")
+    other = main.MintRequest(cusip="912796YB9", amount="200", date="2026-01-01")
+
+    async def send_both():
+        return (
+            await main.mint_tbill(first, idempotency_key="k"),
+            await main.mint_tbill(other, idempotency_key="k"),
+        )
+
+    ok, reused = asyncio.run(send_both())
+    assert ok.status_code == 200
+    assert reused.status_code == 422
+
+
+def test_retry_after_a_submit_timeout_does_not_resubmit(monkeypatch):
+    # The first submit times out after sending: the tx may be on the ledger,
+    # so the retry must get its hash back rather than mint again.
+    submitted = []
+
+    async def fake_rpc(request):
+        submitted.append(request.tx_blob)
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(main, "rpc", fake_rpc)
+    monkeypatch.setattr(main, "_next_sequence", 6)
+    monkeypatch.setattr(main, "track_validation", lambda mint_hash: None)
+    # No process pool here: sign on the default executor with this
+    # process's keys
+    monkeypatch.setattr(main.signing, "_worker_keys", main.signing.load_signer_keys())
+    req = main.MintRequest(cusip="912796YB9", amount="100.5", date="2026-01-01")
+
+    async def send_twice():
+        return (
+            await main.mint_tbill(req, idempotency_key="retry-2"),
+            await main.mint_tbill(req, idempotency_key="retry-2"),
+        )
+
+    first, retry = asyncio.run(send_twice())
+    assert len(submitted) == 1
+    assert first.status_code == retry.status_code == 202
+    assert first.body == retry.body
+    assert main.tx_hash(bytes.fromhex(submitted[0])).encode() in first.body
+    assert main._next_sequence == 7
+
+
+def test_pre_seq_mint_stays_cached(monkeypatch):
+    # terPRE_SEQ may still apply once the gap fills: resync, but keep the
+    # hash cached and tracked instead of failing the mint
+    calls, tracked, resyncs = [], [], []
+
+    async def fake_mint_once(value):
+        calls.append(value)
+        return MINT_HASH, "terPRE_SEQ"
+
+    async def fake_resync():
+        resyncs.append(True)
+
+    monkeypatch.setattr(main, "mint_once", fake_mint_once)
+    monkeypatch.setattr(main, "resync_sequence", fake_resync)
+    monkeypatch.setattr(main, "track_validation", tracked.append)
+    req = main.MintRequest(cusip="912796YB9", amount="100.5", date="2026-01-01")
+
+    async def send_twice():
+        return (
+            await main.mint_tbill(req, idempotency_key=None),
+            await main.mint_tbill(req, idempotency_key=None),
+        )
+
+    first, retry = asyncio.run(send_twice())
+    assert first.status_code == retry.status_code == 202
+    assert len(calls) == len(resyncs) == 1
+    assert tracked == [MINT_HASH]
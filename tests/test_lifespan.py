@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+import main
+
+
+def test_failed_startup_closes_what_was_opened(monkeypatch):
+    events = []
+
+    async def record(name):
+        events.append(name)
+
+    async def failing_resync():
+        raise OSError("node unreachable")
+
+    monkeypatch.setattr(main.client, "open", lambda: record("open"))
+    monkeypatch.setattr(main.client, "close", lambda: record("close"))
+    monkeypatch.setattr(main, "resync_sequence", failing_resync)
+    monkeypatch.setattr(main, "start_sign_pool", lambda: record("sign pool"))
+
+    async def start():
+        async with main.lifespan(main.app):
+            pass
+
+    with pytest.raises(OSError):
+        asyncio.run(start())
+    assert events == ["open", "close"]
+
+
+def test_shutdown_awaits_background_tasks(monkeypatch):
+    started = []
+
+    async def forever():
+        started.append(asyncio.current_task())
+        await asyncio.Event().wait()
+
+    async def noop():
+        pass
+
+    monkeypatch.setattr(main.client, "open", noop)
+    monkeypatch.setattr(main.client, "close", noop)
+    monkeypatch.setattr(main, "resync_sequence", noop)
+    monkeypatch.setattr(main, "start_sign_pool", noop)
+    monkeypatch.setattr(main, "follow_issuer_stream", forever)
+    monkeypatch.setattr(main, "keep_pool_warm", forever)
+
+    async def run():
+        async with main.lifespan(main.app):
+            await asyncio.sleep(0)
+        return started
+
+    tasks = asyncio.run(run())
+    assert len(tasks) == 2
+    assert all(task.cancelled() for task in tasks)
@@ -0,0 +1,126 @@
+"""The hand-written mint encoding must match xrpl-py's canonical encoder."""
+import random
+from decimal import Decimal
+
+import pytest
+from xrpl.core.binarycodec import encode, encode_for_multisigning
+from xrpl.core.binarycodec.binary_wrappers.binary_serializer import (
+    _encode_variable_length_prefix,
+)
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
+from xrpl.core.binarycodec.types.amount import _serialize_issued_currency_value
+from xrpl.core.keypairs import is_valid_message
+from xrpl.wallet import Wallet
+
+import main
+import signing
+from mint_codec import account_id, encode_signer, iou_value, issued_amount, vl_prefix
+
+SIGNER_KEYS = signing.load_signer_keys()
+SIGNER_ADDRESSES = {}    # AccountID -> classic address, for the reference encoder
+for seed in main.settings.signer_seeds:
+    address = Wallet(seed.get_secret_value(), 0).classic_address
+    SIGNER_ADDRESSES[account_id(address)] = address
+
+
+def reference_tx(value: str, sequence: int) -> dict:
+    amount = {"currency": main.CURRENCY_HEX, "issuer": main.ISSUER_ADDR, "value": value}
+    return {**main._PAYMENT_TEMPLATE, "Amount": amount, "SendMax": amount, "Sequence": sequence}
+
+
+def encode_fields(value: str, sequence: int) -> bytes:
+    amount = issued_amount(iou_value(value), main.CURRENCY_BYTES, main.ISSUER_ACCOUNT_ID)
+    return main.PAYMENT_CODEC.encode_fields({
+        "Amount": amount,
+        "SendMax": amount,
+        "Sequence": sequence.to_bytes(4, "big"),
+    })
+
+
+@pytest.mark.parametrize("case", range(200))
+def test_blob_matches_xrpl_encoder(case):
+    rng = random.Random(case)
+    value = rng.choice([
+        str(rng.randint(1, 10**9)),
+        str(round(rng.random() * 10 ** rng.randint(-5, 9), 6)),
+        "0.000001",
+        "1e-5",
+    ])
+    sequence = rng.randint(1, 2**32 - 1)
+    tx = reference_tx(value, sequence)
+    fields = encode_fields(value, sequence)
+    assert fields.hex().upper() == encode(tx)
+
+    prefix = main.PAYMENT_CODEC.multisigning_prefix(fields)
+    for key in SIGNER_KEYS:
+        expected = encode_for_multisigning(tx, SIGNER_ADDRESSES[key.account_id])
+        assert (prefix + key.account_id).hex().upper() == expected
+
+    signatures = [bytes([rng.randrange(256)]) * rng.choice([64, 70, 71, 72]) for _ in SIGNER_KEYS]
+    entries = [encode_signer(k.account_id, k.public_key, s) for k, s in zip(SIGNER_KEYS, signatures)]
+    signers = [
+        {"Signer": {
+            "Account": SIGNER_ADDRESSES[k.account_id],
+            "TxnSignature": s.hex().upper(),
+            "SigningPubKey": k.public_key.hex().upper(),
+        }}
+        for k, s in zip(SIGNER_KEYS, signatures)
+    ]
+    assert main.PAYMENT_CODEC.encode_blob(fields, entries).hex().upper() == encode({**tx, "Signers": signers})
+
+
+def test_signatures_verify_against_xrpl_payload():
+    tx = reference_tx("100.5", 7)
+    prefix = main.PAYMENT_CODEC.multisigning_prefix(encode_fields("100.5", 7))
+    for key in SIGNER_KEYS:
+        entry = signing.multisign_entry(prefix, key)
+        signature = entry[-(1 + 2 + 20 + 64):-(1 + 2 + 20)]    # ed25519: 64 bytes
+        payload = bytes.fromhex(encode_for_multisigning(tx, SIGNER_ADDRESSES[key.account_id]))
+        assert is_valid_message(payload, signature, key.public_key.hex().upper())
+
+
+@pytest.mark.parametrize("value", [
+    "0", "1", "-1", "100.5", "0.000001", "123.4560000",
+    "9999999999999999",        # largest mantissa
+    "1000000000000000",        # smallest normalized mantissa
+    "0.1000000000000000",
+    "1234567890123456e-96",    # smallest exponent after normalizing
+])
+def test_iou_value_matches_xrpl(value):
+    assert iou_value(value) == bytes(_serialize_issued_currency_value(value))
+
+
+def iou_serial(mantissa: int, exponent: int) -> bytes:
+    return (0xC000000000000000 | (exponent + 97) << 54 | mantissa).to_bytes(8, "big")
+
+
+@pytest.mark.parametrize("value, mantissa, exponent", [
+    # Representable, but refused by xrpl-py's stricter checks
+    ("1e+20", 10**15, 5),
+    ("9999999999999999e80", 10**16 - 1, 80),
+    ("1e-81", 10**15, -96),
+])
+def test_iou_value_at_exponent_bounds(value, mantissa, exponent):
+    assert iou_value(value) == iou_serial(mantissa, exponent)
+    assert iou_value(Decimal(value)) == iou_serial(mantissa, exponent)
+
+
+@pytest.mark.parametrize("value", [
+    "12345678901234567",       # 17 significant digits
+    "1e-82",                   # below the smallest exponent
+    "1e96",                    # above the largest exponent
+    "NaN", "Infinity", "abc",
+])
+def test_iou_value_rejects_unrepresentable(value):
+    with pytest.raises(XRPLBinaryCodecException):
+        iou_value(value)
+
+
+@pytest.mark.parametrize("length", [0, 1, 192, 193, 12480, 12481, 918744])
+def test_vl_prefix_matches_xrpl(length):
+    assert vl_prefix(length) == bytes(_encode_variable_length_prefix(length))
+
+
+def test_vl_prefix_too_long():
+    with pytest.raises(ValueError):
+        vl_prefix(918745)
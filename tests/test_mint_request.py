@@ -0,0 +1,38 @@
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from main import MintRequest
+
+
+def mint_request(amount):
+    return MintRequest(cusip="912796YB9", amount=amount, date="2026-01-01")
+
+
+@pytest.mark.parametrize("amount", [
+    "100.5", "1e20", "1e17", "0.000001", 100,
+    "1234567890.123456",       # 16 significant digits
+    "12345678901234560000",    # trailing zeros are not significant
+])
+def test_representable_amounts_are_accepted(amount):
+    assert mint_request(amount).amount == Decimal(str(amount))
+
+
+@pytest.mark.parametrize("amount", ["12345678901234567", "0.12345678901234567", 0, -1, "NaN"])
+def test_unrepresentable_amounts_are_rejected(amount):
+    with pytest.raises(ValidationError):
+        mint_request(amount)
+
+
+@pytest.mark.parametrize("amount", ["8.000000000000001", "1e20", "100.5"])
+def test_json_number_amounts_are_rejected(amount):
+    # Parsed as a float before validation; 8.000000000000001 would round
+    body = f'{{"cusip": "912796YB9", "amount": {amount}, "date": "2026-01-01"}}'
+    with pytest.raises(ValidationError):
+        MintRequest.model_validate_json(body)
+
+
+def test_json_string_amount_keeps_every_digit():
+    body = '{"cusip": "912796YB9", "amount": "8.000000000000001", "date": "2026-01-01"}'
+    assert MintRequest.model_validate_json(body).amount == Decimal("8.000000000000001")